@@ -1,6 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Any, Dict, Optional, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Tuple
+import copy
+import itertools
 import logging
+import threading
+import time
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from .exceptions import APIError, AuthenticationError, InvalidParameterError
 from .validators import Validator
@@ -10,45 +33,380 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Ordered values are kept for error messages, frozensets for membership checks
+_PLAN_OPTIONS = ('residential', 'mobile', 'IPv6', 'datacenter', 'ISP')
+_ISP_REGIONS = (
+    "virm", "dtag", "vocu", "dtag_nl", "pol", "bra", "lva",
+    "fra", "rou", "can", "nor", "aut", "ukr", "tur", "jpn", "isr",
+    "twn", "kor", "esp", "sgp", "hkn", "tha", "ind", "ita"
+)
+# Plain strings on purpose: str caches its hash, so lookups beat re-encoding regions as integer keys
+_VALID_ISP_REGIONS = frozenset(_ISP_REGIONS)
+_VALID_ACTIONS = frozenset({'add', 'remove'})
+_VALID_DATACENTER_PLANS = frozenset({1, 7, 30})
+_VALID_PROXY_TYPES = frozenset({'http', 'socks'})
+
+# Connections kept per host; also caps concurrency of bulk operations
+_POOL_MAXSIZE = 20
+
+def _is_member(value: Any, valid: frozenset) -> bool:
+    # Unhashable values (e.g. lists) are simply invalid, not a TypeError
+    try:
+        return value in valid
+    except TypeError:
+        return False
+
+
+# Endpoint prefixes for the per-plan read calls
+_EP_RESIDENTIAL_READ = "plan/residential/read/"
+_EP_IPV6_READ = "plan/ipv6/read/"
+_EP_DATACENTER_READ = "plan/datacenter/read/"
+_EP_MOBILE_READ = "plan/mobile/read/"
+_EP_ISP_READ = "plan/isp/read/"
+_EP_INFO = "info/"
+
+# Reference data (country/state/city/ISP lists) changes rarely, so it is cached per endpoint
+_COUNTRY_LIST_TTL = 24 * 60 * 60
+_REFERENCE_LIST_TTL = 60 * 60
+
+
+class _TTLCache:
+    """
+    Minimal thread-safe time-based cache for reference data lookups.
+
+    Values are copied on the way in and out so callers can never mutate the cached data.
+    """
+
+    __slots__ = ('maxsize', '_data', '_lock')
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: Dict[Tuple, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+        # Stored values are never mutated, so copying outside the lock is safe
+        return copy.deepcopy(value)
+
+    def set(self, key: Tuple, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        entry = (copy.deepcopy(value), time.monotonic() + ttl)
+        with self._lock:
+            if len(self._data) >= self.maxsize and key not in self._data:
+                # Evict the oldest entry
+                del self._data[next(iter(self._data))]
+            self._data[key] = entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _build_residential(kwargs: Dict) -> Dict:
+    bandwidth = kwargs.get('bandwidth')
+    if bandwidth is None:
+        raise ValueError("Parameter 'bandwidth' is required for residential plan.")
+    return {'bandwidth': str(bandwidth)}
+
+
+def _build_mobile(kwargs: Dict) -> Dict:
+    bandwidth = kwargs.get('bandwidth')
+    if bandwidth is None:
+        raise ValueError("Parameter 'bandwidth' is required for mobile plan.")
+    return {'bandwidth': str(bandwidth)}
+
+
+def _build_ipv6(kwargs: Dict) -> Dict:
+    plan = kwargs.get('plan')
+    speed = kwargs.get('speed')
+    if plan is not None and speed is not None:
+        # IPv6 - Unlimited Plan
+        return {'plan': plan, 'speed': speed}
+    bandwidth = kwargs.get('bandwidth')
+    if bandwidth is not None:
+        # IPv6 - Bandwidth Plan
+        return {'bandwidth': bandwidth}
+    raise ValueError("For IPv6 plan, provide either 'plan' and 'speed' or 'bandwidth'.")
+
+
+def _build_datacenter(kwargs: Dict) -> Dict:
+    plan = kwargs.get('plan')
+    if plan is None:
+        raise ValueError("Parameter 'plan' is required for datacenter plan.")
+    if not _is_member(plan, _VALID_DATACENTER_PLANS):
+        raise ValueError("Parameter 'plan' must be one of the following values: 1, 7, 30.")
+    return {'plan': str(plan)}
+
+
+def _build_isp(kwargs: Dict) -> Dict:
+    ip = kwargs.get('ip')
+    region = kwargs.get('region')
+    if ip is None or region is None:
+        raise ValueError("Parameters 'ip' and 'region' are required for ISP plan.")
+    if not _is_member(region, _VALID_ISP_REGIONS):
+        raise ValueError(f"Invalid region '{region}'. Valid regions are: {list(_ISP_REGIONS)}")
+    return {'ip': ip, 'region': region}
+
+
+# Request body builders for each purchasable plan option
+_PLAN_BUILDERS = {
+    'residential': _build_residential,
+    'mobile': _build_mobile,
+    'IPv6': _build_ipv6,
+    'datacenter': _build_datacenter,
+    'ISP': _build_isp,
+}
+
+
+def _build_purchase_payload(option: str, kwargs: Dict) -> Dict:
+    builder = _PLAN_BUILDERS.get(option) if isinstance(option, str) else None
+    if builder is None:
+        raise ValueError(f"Invalid option '{option}'. Valid options are: {list(_PLAN_OPTIONS)}")
+    return builder(kwargs)
+
+
+def _validate_plan_id(plan_id: str) -> None:
+    if not plan_id:
+        raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
+
+
+def _validate_pagination(page: int, limit: int) -> None:
+    if not isinstance(page, int) or page < 1:
+        raise ValueError("Parameter 'page' must be a positive integer.")
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError("Parameter 'limit' must be a positive integer.")
+
+
+def _validate_action_and_plan_id(action: str, plan_id: str) -> None:
+    if not _is_member(action, _VALID_ACTIONS):
+        raise ValueError("Parameter 'action' must be either 'add' or 'remove'.")
+    _validate_plan_id(plan_id)
+
+
+def _validate_whitelist_args(action: str, plan_id: str, ip_address: str) -> None:
+    _validate_action_and_plan_id(action, plan_id)
+    if not ip_address:
+        raise ValueError("Parameter 'ip_address' is required and cannot be empty.")
+    Validator.validate_ip(ip_address)
+
+
+def _classify_gb(gb: Any, allow_float: bool) -> str:
+    # Exact type checks: cheaper than isinstance and they reject bool
+    t = type(gb)
+    if t is int:
+        return 'int'
+    if t is float and allow_float:
+        return 'float'
+    if allow_float:
+        raise ValueError("Parameter 'gb' must be a positive number.")
+    raise ValueError("Parameter 'gb' must be a positive integer.")
+
+
+def _validate_gigabyte_args(action: str, plan_id: str, gb: float, allow_float: bool) -> None:
+    if not _is_member(action, _VALID_ACTIONS):
+        raise ValueError("Parameter 'action' must be either 'add' or 'remove'.")
+    _validate_plan_id(plan_id)
+    kind = _classify_gb(gb, allow_float)
+    if gb <= 0:
+        if allow_float:
+            raise ValueError("Parameter 'gb' must be a positive number.")
+        raise ValueError("Parameter 'gb' must be a positive integer.")
+    if action == 'add' and kind != 'int':
+        raise ValueError("For 'add' action, 'gb' must be a whole number (integer).")
+
+
+def _validate_country_code(country_code: str) -> None:
+    if not country_code:
+        raise ValueError("Parameter 'country_code' is required and cannot be empty.")
+    if not isinstance(country_code, str):
+        raise ValueError("Parameter 'country_code' must be a string.")
+
+
+def _validate_state(state: str) -> None:
+    if not state:
+        raise ValueError("Parameter 'state' is required and cannot be empty.")
+    if not isinstance(state, str):
+        raise ValueError("Parameter 'state' must be a string.")
+
+
+def _validate_product_plan_id(plan_id: str) -> None:
+    _validate_plan_id(plan_id)
+    if not isinstance(plan_id, str):
+        raise ValueError("Parameter 'plan_id' must be a string.")
+
+
+def _build_credentials_payload(subscription_id: str, plan_type: str, username: str, password: str,
+                               proxy_type: Optional[str]) -> Dict:
+    # Validate parameters
+    if not subscription_id or not isinstance(subscription_id, str):
+        raise ValueError("Subscription ID must be a non-empty string.")
+
+    Validator.validate_plan_type(plan_type)
+    Validator.validate_username(username, plan_type)
+    Validator.validate_password(password, plan_type)
+
+    if plan_type == 'isp':
+        if not _is_member(proxy_type, _VALID_PROXY_TYPES):
+            raise ValueError("Proxy type must be either 'http' or 'socks' for ISP plans.")
+    else:
+        if proxy_type is not None:
+            raise ValueError("Proxy type should be omitted for residential plans.")
+
+    payload = {
+        'planType': plan_type,
+        'username': username,
+        'password': password
+    }
+    if plan_type == 'isp':
+        payload['proxyType'] = proxy_type
+    return payload
+
+
+def _extract_list(response: Dict, key: str) -> List[Dict[str, str]]:
+    items = response.get(key)
+    if items is None:
+        raise APIError(f"Response JSON does not contain '{key}'.")
+    return items
+
+
+def _ensure_list(response: Any) -> List[Dict[str, Any]]:
+    if not isinstance(response, list):
+        raise APIError("Response JSON is not a list as expected.")
+    return response
+
+
 class RequestHandler:
+    __slots__ = ('api_key', 'base_url', 'headers', 'session', '_url_prefix')
+
     def __init__(self, api_key: str, base_url: str):
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
+        self._url_prefix = self.base_url + '/'
         self.headers = {
             "x-api-key": self.api_key,
             "Content-Type": "application/json"
         }
+        # Reuse connections across calls to avoid a TCP/TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # raise_on_status=False returns the last 5xx response so it is mapped to APIError
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
-        url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params)
+        url = self._url_prefix + endpoint
+        response = self.session.get(url, params=params)
         return self._handle_response(response)
 
     def post(self, endpoint: str, data: Optional[Dict] = None, json_data: Optional[Dict] = None) -> Any:
-        url = f"{self.base_url}/{endpoint}"
-        response = requests.post(url, headers=self.headers, data=data, json=json_data)
+        url = self._url_prefix + endpoint
+        if json_data is not None:
+            # Serialize here rather than via requests' json= encoder; Content-Type is set on the session
+            data = _dumps(json_data)
+        response = self.session.post(url, data=data)
         return self._handle_response(response)
 
+    def post_stream(self, endpoint: str) -> Iterator[Any]:
+        """
+        POST to an endpoint returning a JSON array and yield its items one by one.
+        The body is parsed incrementally with ijson when installed; otherwise it is
+        decoded in full and iterated.
+        """
+        if ijson is None:
+            yield from _ensure_list(self.post(endpoint))
+            return
+        url = self._url_prefix + endpoint
+        with self.session.post(url, stream=True) as response:
+            if response.status_code >= 400:
+                # Raises the matching APIError/AuthenticationError
+                self._handle_response(response)
+            logger.info("Request successful: %s", response.url)
+            response.raw.decode_content = True
+            events = ijson.parse(response.raw, use_float=True)
+            try:
+                first = next(events, None)
+            except Exception as err:
+                logger.error("Other error occurred: %s", err)
+                raise APIError(f"Other error occurred: {err}")
+            if first is None or first[:2] != ('', 'start_array'):
+                raise APIError("Response JSON is not a list as expected.")
+            items = ijson.items(itertools.chain((first,), events), 'item')
+            while True:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+                except Exception as err:
+                    logger.error("Other error occurred: %s", err)
+                    raise APIError(f"Other error occurred: {err}")
+                yield item
+
+    def close(self) -> None:
+        self.session.close()
+
     def _handle_response(self, response: requests.Response) -> Any:
+        status = response.status_code
+        if status >= 400:
+            error = f"{status} {response.reason} for url: {response.url}"
+            if status == 401:
+                logger.error("Authentication error: %s - Response: %s", error, response.text)
+                raise AuthenticationError(f"Authentication failed: {error} - Response: {response.text}")
+            logger.error("HTTP error occurred: %s - Response: %s", error, response.text)
+            raise APIError(f"HTTP error occurred: {error} - Response: {response.text}")
+        logger.info("Request successful: %s", response.url)
         try:
-            response.raise_for_status()
-            logger.info(f"Request successful: {response.url}")
-            return response.json()
-        except requests.exceptions.HTTPError as http_err:
-            if response.status_code == 401:
-                logger.error(f"Authentication error: {http_err} - Response: {response.text}")
-                raise AuthenticationError(f"Authentication failed: {http_err} - Response: {response.text}")
-            else:
-                logger.error(f"HTTP error occurred: {http_err} - Response: {response.text}")
-                raise APIError(f"HTTP error occurred: {http_err} - Response: {response.text}")
+            return _loads(response.content)
         except Exception as err:
-            logger.error(f"Other error occurred: {err}")
+            logger.error("Other error occurred: %s", err)
             raise APIError(f"Other error occurred: {err}")
 
 
 class LightningProxiesAPI:
-    def __init__(self, api_key: str, base_url: str = "https://resell.lightningproxies.net/api"):
+    __slots__ = ('request_handler', 'cache_ttl', '_reference_cache')
+
+    def __init__(self, api_key: str, base_url: str = "https://resell.lightningproxies.net/api",
+                 cache_ttl: Optional[float] = None):
+        """
+        :param api_key: Your Lightning Proxies API key.
+        :param base_url: Base URL of the API.
+        :param cache_ttl: Lifetime in seconds of cached reference lists (countries, states, cities, ISPs).
+                          Defaults to 24h for country lists and 1h for the others; 0 disables caching.
+        """
         self.request_handler = RequestHandler(api_key, base_url)
+        self.cache_ttl = cache_ttl
+        self._reference_cache = _TTLCache()
+
+    def invalidate_reference_cache(self) -> None:
+        """
+        Drop all cached reference lists so the next lookup hits the API.
+        """
+        self._reference_cache.clear()
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        self.request_handler.close()
+
+    def _ttl(self, default: float) -> float:
+        return default if self.cache_ttl is None else self.cache_ttl
+
+    def __enter__(self) -> "LightningProxiesAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def purchase_plan(self, option: str, **kwargs) -> Dict:
         """
@@ -58,66 +416,14 @@ class LightningProxiesAPI:
         :param kwargs: Parameters depending on the type of the plan.
         :return: API response.
         """
-        valid_options = ['residential', 'mobile', 'IPv6', 'datacenter', 'ISP']
-        if option not in valid_options:
-            raise ValueError(f"Invalid option '{option}'. Valid options are: {valid_options}")
-
+        payload = _build_purchase_payload(option, kwargs)
         endpoint = f"getplan/{option}"
-
-        # Prepare the request body depending on the option
-        payload = {}
-        if option == 'residential':
-            bandwidth = kwargs.get('bandwidth')
-            if bandwidth is None:
-                raise ValueError("Parameter 'bandwidth' is required for residential plan.")
-            payload['bandwidth'] = str(bandwidth)
-
-        elif option == 'mobile':
-            bandwidth = kwargs.get('bandwidth')
-            if bandwidth is None:
-                raise ValueError("Parameter 'bandwidth' is required for mobile plan.")
-            payload['bandwidth'] = str(bandwidth)
-
-        elif option == 'IPv6':
-            plan = kwargs.get('plan')
-            speed = kwargs.get('speed')
-            bandwidth = kwargs.get('bandwidth')
-
-            if plan is not None and speed is not None:
-                # IPv6 - Unlimited Plan
-                payload['plan'] = plan
-                payload['speed'] = speed
-            elif bandwidth is not None:
-                # IPv6 - Bandwidth Plan
-                payload['bandwidth'] = bandwidth
-            else:
-                raise ValueError("For IPv6 plan, provide either 'plan' and 'speed' or 'bandwidth'.")
-
-        elif option == 'datacenter':
-            plan = kwargs.get('plan')
-            if plan is None:
-                raise ValueError("Parameter 'plan' is required for datacenter plan.")
-            if plan not in [1, 7, 30]:
-                raise ValueError("Parameter 'plan' must be one of the following values: 1, 7, 30.")
-            payload['plan'] = str(plan)
-
-        elif option == 'ISP':
-            ip = kwargs.get('ip')
-            region = kwargs.get('region')
-            if ip is None or region is None:
-                raise ValueError("Parameters 'ip' and 'region' are required for ISP plan.")
-            valid_regions = [
-                "virm", "dtag", "vocu", "dtag_nl", "pol", "bra", "lva",
-                "fra", "rou", "can", "nor", "aut", "ukr", "tur", "jpn", "isr",
-                "twn", "kor", "esp", "sgp", "hkn", "tha", "ind", "ita"
-            ]
-            if region not in valid_regions:
-                raise ValueError(f"Invalid region '{region}'. Valid regions are: {valid_regions}")
-            payload['ip'] = ip
-            payload['region'] = region
-
         return self.request_handler.post(endpoint, json_data=payload)
 
+    def _get_proxy_info(self, endpoint_prefix: str, plan_id: str) -> Dict:
+        _validate_plan_id(plan_id)
+        return self.request_handler.get(endpoint_prefix + str(plan_id))
+
     def get_residential_proxy_info(self, plan_id: str) -> Dict:
         """
         Get Residential proxy information by planId.
@@ -125,11 +431,7 @@ class LightningProxiesAPI:
         :param plan_id: The plan identifier (planId) of the product you purchased.
         :return: API response with proxy information.
         """
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-
-        endpoint = f"plan/residential/read/{plan_id}"
-        return self.request_handler.get(endpoint)
+        return self._get_proxy_info(_EP_RESIDENTIAL_READ, plan_id)
 
     def get_ipv6_proxy_info(self, plan_id: str) -> Dict:
         """
@@ -138,11 +440,7 @@ class LightningProxiesAPI:
         :param plan_id: The plan identifier (planId) of the product you purchased.
         :return: API response with IPv6 proxy information.
         """
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-
-        endpoint = f"plan/ipv6/read/{plan_id}"
-        return self.request_handler.get(endpoint)
+        return self._get_proxy_info(_EP_IPV6_READ, plan_id)
 
     def get_datacenter_proxy_info(self, plan_id: str) -> Dict:
         """
@@ -151,11 +449,7 @@ class LightningProxiesAPI:
         :param plan_id: The plan identifier (planId) of the product you purchased.
         :return: API response with Datacenter proxy information.
         """
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-
-        endpoint = f"plan/datacenter/read/{plan_id}"
-        return self.request_handler.get(endpoint)
+        return self._get_proxy_info(_EP_DATACENTER_READ, plan_id)
 
     def get_mobile_proxy_info(self, plan_id: str) -> Dict:
         """
@@ -164,11 +458,7 @@ class LightningProxiesAPI:
         :param plan_id: The plan identifier (planId) of the product you purchased.
         :return: API response with Mobile proxy information.
         """
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-
-        endpoint = f"plan/mobile/read/{plan_id}"
-        return self.request_handler.get(endpoint)
+        return self._get_proxy_info(_EP_MOBILE_READ, plan_id)
 
     def get_isp_proxy_info(self, plan_id: str) -> Dict:
         """
@@ -177,11 +467,7 @@ class LightningProxiesAPI:
         :param plan_id: The plan identifier (planId) of the product you purchased.
         :return: API response with ISP proxy information.
         """
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-
-        endpoint = f"plan/isp/read/{plan_id}"
-        return self.request_handler.get(endpoint)
+        return self._get_proxy_info(_EP_ISP_READ, plan_id)
 
     def get_residential_mass_check(self, page: int, limit: int) -> List[Dict]:
         """
@@ -191,15 +477,37 @@ class LightningProxiesAPI:
         :param limit: Number of records per page.
         :return: List of dictionaries with Residential proxy information.
         """
-        if not isinstance(page, int) or page < 1:
-            raise ValueError("Parameter 'page' must be a positive integer.")
-        if not isinstance(limit, int) or limit < 1:
-            raise ValueError("Parameter 'limit' must be a positive integer.")
+        _validate_pagination(page, limit)
 
         # Form the final URL with pagination parameters
         endpoint = f"plan/{page}-{limit}"
         return self.request_handler.post(endpoint)
 
+    def iter_residential_mass_check(self, limit: int = 500) -> Iterator[Dict]:
+        """
+        Iterate over all Residential proxies, fetching pages lazily.
+
+        Only one page is held in memory at a time (or a single record when ijson is installed).
+
+        :param limit: Number of records per page.
+        :return: Iterator of dictionaries with Residential proxy information.
+        """
+        # Validate eagerly; a generator body would defer the error to the first next()
+        _validate_pagination(1, limit)
+        return self._iter_residential_mass_check(limit)
+
+    def _iter_residential_mass_check(self, limit: int) -> Iterator[Dict]:
+        page = 1
+        while True:
+            count = 0
+            for record in self.request_handler.post_stream(f"plan/{page}-{limit}"):
+                count += 1
+                yield record
+            # The server may cap page sizes below limit, so only an empty page ends the listing
+            if not count:
+                return
+            page += 1
+
     def manage_ipv6_whitelist(self, action: str, plan_id: str, ip_address: str) -> Dict:
         """
         Add or remove an IP address from the IPv6 proxy whitelist.
@@ -209,17 +517,39 @@ class LightningProxiesAPI:
         :param ip_address: IP address to add or remove from the whitelist.
         :return: API response with the result message.
         """
-        if action not in ['add', 'remove']:
-            raise ValueError("Parameter 'action' must be either 'add' or 'remove'.")
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-        if not ip_address:
-            raise ValueError("Parameter 'ip_address' is required and cannot be empty.")
-        Validator.validate_ip(ip_address)
+        _validate_whitelist_args(action, plan_id, ip_address)
 
         endpoint = f"plan/ipv6/{action}/whitelist/{plan_id}/{ip_address}"
         return self.request_handler.post(endpoint)
 
+    def manage_ipv6_whitelist_bulk(self, action: str, plan_id: str, ip_addresses: Iterable[str]) -> List[Dict]:
+        """
+        Add or remove several IP addresses from the IPv6 proxy whitelist concurrently.
+
+        Duplicates are dropped and every argument is validated before any request is sent.
+        The call is not atomic: if one request fails, its exception is re-raised once the
+        others have finished, and those other changes stay applied on the server while
+        their responses are discarded.
+
+        :param action: Action ('add' or 'remove').
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :param ip_addresses: IP addresses to add or remove from the whitelist.
+        :return: List of API responses, one per unique IP address in first-seen order.
+        """
+        _validate_action_and_plan_id(action, plan_id)
+        ip_addresses = list(dict.fromkeys(ip_addresses))
+        for ip_address in ip_addresses:
+            _validate_whitelist_args(action, plan_id, ip_address)
+        if not ip_addresses:
+            return []
+
+        # Bounded by the connection pool size so workers do not wait on sockets
+        with ThreadPoolExecutor(max_workers=min(_POOL_MAXSIZE, len(ip_addresses))) as executor:
+            return list(executor.map(
+                lambda ip_address: self.manage_ipv6_whitelist(action, plan_id, ip_address),
+                ip_addresses
+            ))
+
     def manage_datacenter_whitelist(self, action: str, plan_id: str, ip_address: str) -> Dict:
         """
         Add or remove an IP address from the Datacenter proxy whitelist.
@@ -229,13 +559,7 @@ class LightningProxiesAPI:
         :param ip_address: IP address to add or remove from the whitelist.
         :return: API response with the result message.
         """
-        if action not in ['add', 'remove']:
-            raise ValueError("Parameter 'action' must be either 'add' or 'remove'.")
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-        if not ip_address:
-            raise ValueError("Parameter 'ip_address' is required and cannot be empty.")
-        Validator.validate_ip(ip_address)
+        _validate_whitelist_args(action, plan_id, ip_address)
 
         endpoint = f"plan/datacenter/{action}/whitelist/{plan_id}/{ip_address}"
         return self.request_handler.post(endpoint)
@@ -249,15 +573,7 @@ class LightningProxiesAPI:
         :param gb: Number of gigabytes to add or remove.
         :return: API response with the result message.
         """
-        if action not in ['add', 'remove']:
-            raise ValueError("Parameter 'action' must be either 'add' or 'remove'.")
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-        if not isinstance(gb, int) or gb <= 0:
-            raise ValueError("Parameter 'gb' must be a positive integer.")
-
-        endpoint = f"{action}/{plan_id}/{gb}"
-        return self.request_handler.post(endpoint)
+        return self._manage_gigabyte(action, plan_id, gb, allow_float=False)
 
     def manage_residential_gigabyte(self, action: str, plan_id: str, gb: float) -> Dict:
         """
@@ -270,17 +586,7 @@ class LightningProxiesAPI:
                    - For removing: whole or decimal numbers (1, 2.15, 0.15, etc.).
         :return: API response with the result message.
         """
-        if action not in ['add', 'remove']:
-            raise ValueError("Parameter 'action' must be either 'add' or 'remove'.")
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-        if not isinstance(gb, (int, float)) or gb <= 0:
-            raise ValueError("Parameter 'gb' must be a positive number.")
-        if action == 'add' and not isinstance(gb, int):
-            raise ValueError("For 'add' action, 'gb' must be a whole number (integer).")
-
-        endpoint = f"{action}/{plan_id}/{gb}"
-        return self.request_handler.post(endpoint)
+        return self._manage_gigabyte(action, plan_id, gb, allow_float=True)
 
     def manage_mobile_gigabyte(self, action: str, plan_id: str, gb: float) -> Dict:
         """
@@ -293,14 +599,10 @@ class LightningProxiesAPI:
                    - For removing: whole or decimal numbers (1, 2.15, 0.15, etc.).
         :return: API response with the result message.
         """
-        if action not in ['add', 'remove']:
-            raise ValueError("Parameter 'action' must be either 'add' or 'remove'.")
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-        if not isinstance(gb, (int, float)) or gb <= 0:
-            raise ValueError("Parameter 'gb' must be a positive number.")
-        if action == 'add' and not isinstance(gb, int):
-            raise ValueError("For 'add' action, 'gb' must be a whole number (integer).")
+        return self._manage_gigabyte(action, plan_id, gb, allow_float=True)
+
+    def _manage_gigabyte(self, action: str, plan_id: str, gb: float, *, allow_float: bool = True) -> Dict:
+        _validate_gigabyte_args(action, plan_id, gb, allow_float)
 
         endpoint = f"{action}/{plan_id}/{gb}"
         return self.request_handler.post(endpoint)
@@ -311,11 +613,13 @@ class LightningProxiesAPI:
 
         :return: List of dictionaries with 'country_name' and 'country_code'.
         """
-        endpoint = "getlist/country_list"
-        response = self.request_handler.post(endpoint)
-        country_list = response.get("country_list")
+        key = ("country_list",)
+        country_list = self._reference_cache.get(key)
         if country_list is None:
-            raise APIError("Response JSON does not contain 'country_list'.")
+            endpoint = "getlist/country_list"
+            response = self.request_handler.post(endpoint)
+            country_list = _extract_list(response, "country_list")
+            self._reference_cache.set(key, country_list, self._ttl(_COUNTRY_LIST_TTL))
         return country_list
 
     def get_residential_states(self, country_code: str) -> List[Dict[str, str]]:
@@ -325,19 +629,18 @@ class LightningProxiesAPI:
         :param country_code: Country code (e.g., 'us').
         :return: List of dictionaries with 'code'.
         """
-        if not country_code:
-            raise ValueError("Parameter 'country_code' is required and cannot be empty.")
-        if not isinstance(country_code, str):
-            raise ValueError("Parameter 'country_code' must be a string.")
+        _validate_country_code(country_code)
 
-        endpoint = "getlist/state_list"
-        payload = {
-            'country_code': country_code.lower()
-        }
-        response = self.request_handler.post(endpoint, json_data=payload)
-        state_list = response.get("state_list")
+        key = ("state_list", country_code.lower())
+        state_list = self._reference_cache.get(key)
         if state_list is None:
-            raise APIError("Response JSON does not contain 'state_list'.")
+            endpoint = "getlist/state_list"
+            payload = {
+                'country_code': country_code.lower()
+            }
+            response = self.request_handler.post(endpoint, json_data=payload)
+            state_list = _extract_list(response, "state_list")
+            self._reference_cache.set(key, state_list, self._ttl(_REFERENCE_LIST_TTL))
         return state_list
 
     def get_residential_cities(self, country_code: str, state: str) -> List[Dict[str, str]]:
@@ -348,24 +651,20 @@ class LightningProxiesAPI:
         :param state: State name (e.g., 'arizona').
         :return: List of dictionaries with 'code'.
         """
-        if not country_code:
-            raise ValueError("Parameter 'country_code' is required and cannot be empty.")
-        if not state:
-            raise ValueError("Parameter 'state' is required and cannot be empty.")
-        if not isinstance(country_code, str):
-            raise ValueError("Parameter 'country_code' must be a string.")
-        if not isinstance(state, str):
-            raise ValueError("Parameter 'state' must be a string.")
-
-        endpoint = "getlist/city_list"
-        payload = {
-            'country_code': country_code.lower(),
-            'state': state.lower()
-        }
-        response = self.request_handler.post(endpoint, json_data=payload)
-        city_list = response.get("city_list")
+        _validate_country_code(country_code)
+        _validate_state(state)
+
+        key = ("city_list", country_code.lower(), state.lower())
+        city_list = self._reference_cache.get(key)
         if city_list is None:
-            raise APIError("Response JSON does not contain 'city_list'.")
+            endpoint = "getlist/city_list"
+            payload = {
+                'country_code': country_code.lower(),
+                'state': state.lower()
+            }
+            response = self.request_handler.post(endpoint, json_data=payload)
+            city_list = _extract_list(response, "city_list")
+            self._reference_cache.set(key, city_list, self._ttl(_REFERENCE_LIST_TTL))
         return city_list
 
     def get_residential_isp_list(self, country_code: str) -> List[Dict[str, str]]:
@@ -375,19 +674,18 @@ class LightningProxiesAPI:
         :param country_code: Country code (e.g., 'us').
         :return: List of dictionaries with 'name', 'asn', and 'country'.
         """
-        if not country_code:
-            raise ValueError("Parameter 'country_code' is required and cannot be empty.")
-        if not isinstance(country_code, str):
-            raise ValueError("Parameter 'country_code' must be a string.")
+        _validate_country_code(country_code)
 
-        endpoint = "getlist/isp_list"
-        payload = {
-            'country_code': country_code.lower()
-        }
-        response = self.request_handler.post(endpoint, json_data=payload)
-        isp_list = response.get("isp_list")
+        key = ("isp_list", country_code.lower())
+        isp_list = self._reference_cache.get(key)
         if isp_list is None:
-            raise APIError("Response JSON does not contain 'isp_list'.")
+            endpoint = "getlist/isp_list"
+            payload = {
+                'country_code': country_code.lower()
+            }
+            response = self.request_handler.post(endpoint, json_data=payload)
+            isp_list = _extract_list(response, "isp_list")
+            self._reference_cache.set(key, isp_list, self._ttl(_REFERENCE_LIST_TTL))
         return isp_list
 
     def get_mobile_countries(self) -> List[Dict[str, Any]]:
@@ -396,11 +694,14 @@ class LightningProxiesAPI:
 
         :return: List of dictionaries with country information (id, name, iso2, region_id, geo_asns, asnData).
         """
-        endpoint = "getlist/mobile/country"
-        response = self.request_handler.post(endpoint)
-        if not isinstance(response, list):
-            raise APIError("Response JSON is not a list as expected.")
-        return response
+        key = ("mobile_country",)
+        countries = self._reference_cache.get(key)
+        if countries is None:
+            endpoint = "getlist/mobile/country"
+            response = self.request_handler.post(endpoint)
+            countries = _ensure_list(response)
+            self._reference_cache.set(key, countries, self._ttl(_COUNTRY_LIST_TTL))
+        return countries
 
     def get_product_info(self, plan_id: str) -> Dict:
         """
@@ -409,14 +710,9 @@ class LightningProxiesAPI:
         :param plan_id: The plan identifier (planId) of the product you purchased.
         :return: API response with general product information.
         """
-        if not plan_id:
-            raise ValueError("Parameter 'plan_id' is required and cannot be empty.")
-        if not isinstance(plan_id, str):
-            raise ValueError("Parameter 'plan_id' must be a string.")
+        _validate_product_plan_id(plan_id)
 
-        endpoint = f"info/{plan_id}"
-        response = self.request_handler.get(endpoint)
-        return response
+        return self.request_handler.get(_EP_INFO + plan_id)
 
     def change_credentials(self, subscription_id: str, plan_type: str, username: str, password: str,
                            proxy_type: Optional[str] = None) -> Dict:
@@ -430,28 +726,6 @@ class LightningProxiesAPI:
         :param proxy_type: Proxy type ('http' or 'socks'). Used only for ISP. Omit for residential plans.
         :return: API response with the result message.
         """
-        # Validate parameters
-        if not subscription_id or not isinstance(subscription_id, str):
-            raise ValueError("Subscription ID must be a non-empty string.")
-
-        Validator.validate_plan_type(plan_type)
-        Validator.validate_username(username, plan_type)
-        Validator.validate_password(password, plan_type)
-
-        if plan_type == 'isp':
-            if proxy_type not in ['http', 'socks']:
-                raise ValueError("Proxy type must be either 'http' or 'socks' for ISP plans.")
-        else:
-            if proxy_type is not None:
-                raise ValueError("Proxy type should be omitted for residential plans.")
-
+        payload = _build_credentials_payload(subscription_id, plan_type, username, password, proxy_type)
         endpoint = f"credentials-change/{subscription_id}"
-        payload = {
-            'planType': plan_type,
-            'username': username,
-            'password': password
-        }
-        if plan_type == 'isp':
-            payload['proxyType'] = proxy_type
-
         return self.request_handler.post(endpoint, json_data=payload)
\ No newline at end of file
@@ -0,0 +1,395 @@
+import asyncio
+from typing import Any, Dict, Iterable, Optional, List
+import logging
+
+import aiohttp
+
+from .exceptions import APIError, AuthenticationError
+from .api import (
+    _build_purchase_payload,
+    _validate_plan_id,
+    _validate_pagination,
+    _validate_whitelist_args,
+    _validate_action_and_plan_id,
+    _validate_gigabyte_args,
+    _validate_country_code,
+    _validate_state,
+    _validate_product_plan_id,
+    _build_credentials_payload,
+    _extract_list,
+    _ensure_list,
+    _TTLCache,
+    _COUNTRY_LIST_TTL,
+    _REFERENCE_LIST_TTL,
+    _EP_RESIDENTIAL_READ,
+    _EP_IPV6_READ,
+    _EP_DATACENTER_READ,
+    _EP_MOBILE_READ,
+    _EP_ISP_READ,
+    _EP_INFO,
+    _loads,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRequestHandler:
+    __slots__ = ('api_key', 'base_url', 'headers', 'session', '_url_prefix')
+
+    def __init__(self, api_key: str, base_url: str):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self._url_prefix = self.base_url + '/'
+        self.headers = {
+            "x-api-key": self.api_key,
+            "Content-Type": "application/json"
+        }
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # The session must be created inside a running event loop, so it is built lazily
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self.session
+
+    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        url = self._url_prefix + endpoint
+        async with self._get_session().get(url, params=params) as response:
+            return await self._handle_response(response)
+
+    async def post(self, endpoint: str, data: Optional[Dict] = None, json_data: Optional[Dict] = None) -> Any:
+        url = self._url_prefix + endpoint
+        async with self._get_session().post(url, data=data, json=json_data) as response:
+            return await self._handle_response(response)
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _handle_response(self, response: aiohttp.ClientResponse) -> Any:
+        status = response.status
+        if status >= 400:
+            text = await response.text()
+            error = f"{status} {response.reason} for url: {response.url}"
+            if status == 401:
+                logger.error("Authentication error: %s - Response: %s", error, text)
+                raise AuthenticationError(f"Authentication failed: {error} - Response: {text}")
+            logger.error("HTTP error occurred: %s - Response: %s", error, text)
+            raise APIError(f"HTTP error occurred: {error} - Response: {text}")
+        logger.info("Request successful: %s", response.url)
+        try:
+            return _loads(await response.read())
+        except Exception as err:
+            logger.error("Other error occurred: %s", err)
+            raise APIError(f"Other error occurred: {err}")
+
+
+class AsyncLightningProxiesAPI:
+    __slots__ = ('request_handler', 'cache_ttl', '_reference_cache')
+
+    def __init__(self, api_key: str, base_url: str = "https://resell.lightningproxies.net/api",
+                 cache_ttl: Optional[float] = None):
+        """
+        :param api_key: Your Lightning Proxies API key.
+        :param base_url: Base URL of the API.
+        :param cache_ttl: Lifetime in seconds of cached reference lists (countries, states, cities, ISPs).
+                          Defaults to 24h for country lists and 1h for the others; 0 disables caching.
+        """
+        self.request_handler = AsyncRequestHandler(api_key, base_url)
+        self.cache_ttl = cache_ttl
+        self._reference_cache = _TTLCache()
+
+    def invalidate_reference_cache(self) -> None:
+        """
+        Drop all cached reference lists so the next lookup hits the API.
+        """
+        self._reference_cache.clear()
+
+    async def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        await self.request_handler.close()
+
+    def _ttl(self, default: float) -> float:
+        return default if self.cache_ttl is None else self.cache_ttl
+
+    async def __aenter__(self) -> "AsyncLightningProxiesAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def purchase_plan(self, option: str, **kwargs) -> Dict:
+        """
+        Purchase a plan.
+
+        :param option: Type of the plan (residential, mobile, IPv6, datacenter, ISP).
+        :param kwargs: Parameters depending on the type of the plan.
+        :return: API response.
+        """
+        payload = _build_purchase_payload(option, kwargs)
+        endpoint = f"getplan/{option}"
+        return await self.request_handler.post(endpoint, json_data=payload)
+
+    async def _get_proxy_info(self, endpoint_prefix: str, plan_id: str) -> Dict:
+        _validate_plan_id(plan_id)
+        return await self.request_handler.get(endpoint_prefix + str(plan_id))
+
+    async def get_residential_proxy_info(self, plan_id: str) -> Dict:
+        """
+        Get Residential proxy information by planId.
+
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :return: API response with proxy information.
+        """
+        return await self._get_proxy_info(_EP_RESIDENTIAL_READ, plan_id)
+
+    async def get_ipv6_proxy_info(self, plan_id: str) -> Dict:
+        """
+        Get IPv6 proxy information by planId.
+
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :return: API response with IPv6 proxy information.
+        """
+        return await self._get_proxy_info(_EP_IPV6_READ, plan_id)
+
+    async def get_datacenter_proxy_info(self, plan_id: str) -> Dict:
+        """
+        Get Datacenter proxy information by planId.
+
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :return: API response with Datacenter proxy information.
+        """
+        return await self._get_proxy_info(_EP_DATACENTER_READ, plan_id)
+
+    async def get_mobile_proxy_info(self, plan_id: str) -> Dict:
+        """
+        Get Mobile proxy information by planId.
+
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :return: API response with Mobile proxy information.
+        """
+        return await self._get_proxy_info(_EP_MOBILE_READ, plan_id)
+
+    async def get_isp_proxy_info(self, plan_id: str) -> Dict:
+        """
+        Get ISP proxy information by planId.
+
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :return: API response with ISP proxy information.
+        """
+        return await self._get_proxy_info(_EP_ISP_READ, plan_id)
+
+    async def get_residential_mass_check(self, page: int, limit: int) -> List[Dict]:
+        """
+        Mass check Residential proxies using pagination.
+
+        :param page: Page number.
+        :param limit: Number of records per page.
+        :return: List of dictionaries with Residential proxy information.
+        """
+        _validate_pagination(page, limit)
+        return await self.request_handler.post(f"plan/{page}-{limit}")
+
+    async def manage_ipv6_whitelist(self, action: str, plan_id: str, ip_address: str) -> Dict:
+        """
+        Add or remove an IP address from the IPv6 proxy whitelist.
+
+        :param action: Action ('add' or 'remove').
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :param ip_address: IP address to add or remove from the whitelist.
+        :return: API response with the result message.
+        """
+        _validate_whitelist_args(action, plan_id, ip_address)
+        return await self.request_handler.post(f"plan/ipv6/{action}/whitelist/{plan_id}/{ip_address}")
+
+    async def manage_datacenter_whitelist(self, action: str, plan_id: str, ip_address: str) -> Dict:
+        """
+        Add or remove an IP address from the Datacenter proxy whitelist.
+
+        :param action: Action ('add' or 'remove').
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :param ip_address: IP address to add or remove from the whitelist.
+        :return: API response with the result message.
+        """
+        _validate_whitelist_args(action, plan_id, ip_address)
+        return await self.request_handler.post(f"plan/datacenter/{action}/whitelist/{plan_id}/{ip_address}")
+
+    async def bulk_whitelist(self, action: str, plan_id: str, ip_list: Iterable[str]) -> List[Dict]:
+        """
+        Add or remove several IP addresses from the IPv6 proxy whitelist concurrently.
+
+        Every argument is validated before any request is sent. The call is not atomic:
+        if one request fails its exception is raised, while the other requests keep running
+        and their changes stay applied on the server with their responses discarded.
+
+        :param action: Action ('add' or 'remove').
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :param ip_list: IP addresses to add or remove from the whitelist.
+        :return: List of API responses, in the same order as ip_list.
+        """
+        _validate_action_and_plan_id(action, plan_id)
+        ip_list = list(ip_list)
+        # Validate everything before any request is sent
+        for ip in ip_list:
+            _validate_whitelist_args(action, plan_id, ip)
+        return await asyncio.gather(
+            *[self.manage_ipv6_whitelist(action, plan_id, ip) for ip in ip_list]
+        )
+
+    async def manage_ipv6_gigabyte(self, action: str, plan_id: str, gb: int) -> Dict:
+        """
+        Add or remove gigabytes (GB) from the IPv6 plan.
+
+        :param action: Action ('add' or 'remove').
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :param gb: Number of gigabytes to add or remove.
+        :return: API response with the result message.
+        """
+        return await self._manage_gigabyte(action, plan_id, gb, allow_float=False)
+
+    async def manage_residential_gigabyte(self, action: str, plan_id: str, gb: float) -> Dict:
+        """
+        Add or remove gigabytes (GB) from the Residential plan.
+
+        :param action: Action ('add' or 'remove').
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :param gb: Number of gigabytes to add or remove.
+                   - For adding: whole numbers (1, 2, 3, etc.).
+                   - For removing: whole or decimal numbers (1, 2.15, 0.15, etc.).
+        :return: API response with the result message.
+        """
+        return await self._manage_gigabyte(action, plan_id, gb, allow_float=True)
+
+    async def manage_mobile_gigabyte(self, action: str, plan_id: str, gb: float) -> Dict:
+        """
+        Add or remove gigabytes (GB) from the Mobile plan.
+
+        :param action: Action ('add' or 'remove').
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :param gb: Number of gigabytes to add or remove.
+                   - For adding: whole numbers (1, 2, 3, etc.).
+                   - For removing: whole or decimal numbers (1, 2.15, 0.15, etc.).
+        :return: API response with the result message.
+        """
+        return await self._manage_gigabyte(action, plan_id, gb, allow_float=True)
+
+    async def _manage_gigabyte(self, action: str, plan_id: str, gb: float, *, allow_float: bool = True) -> Dict:
+        _validate_gigabyte_args(action, plan_id, gb, allow_float)
+        return await self.request_handler.post(f"{action}/{plan_id}/{gb}")
+
+    async def get_residential_countries(self) -> List[Dict[str, str]]:
+        """
+        Get the list of available countries for Residential proxies.
+
+        :return: List of dictionaries with 'country_name' and 'country_code'.
+        """
+        key = ("country_list",)
+        country_list = self._reference_cache.get(key)
+        if country_list is None:
+            response = await self.request_handler.post("getlist/country_list")
+            country_list = _extract_list(response, "country_list")
+            self._reference_cache.set(key, country_list, self._ttl(_COUNTRY_LIST_TTL))
+        return country_list
+
+    async def get_residential_states(self, country_code: str) -> List[Dict[str, str]]:
+        """
+        Get the list of available states for Residential proxies based on country_code.
+
+        :param country_code: Country code (e.g., 'us').
+        :return: List of dictionaries with 'code'.
+        """
+        _validate_country_code(country_code)
+        key = ("state_list", country_code.lower())
+        state_list = self._reference_cache.get(key)
+        if state_list is None:
+            payload = {
+                'country_code': country_code.lower()
+            }
+            response = await self.request_handler.post("getlist/state_list", json_data=payload)
+            state_list = _extract_list(response, "state_list")
+            self._reference_cache.set(key, state_list, self._ttl(_REFERENCE_LIST_TTL))
+        return state_list
+
+    async def get_residential_cities(self, country_code: str, state: str) -> List[Dict[str, str]]:
+        """
+        Get the list of available cities for Residential proxies based on country_code and state.
+
+        :param country_code: Country code (e.g., 'us').
+        :param state: State name (e.g., 'arizona').
+        :return: List of dictionaries with 'code'.
+        """
+        _validate_country_code(country_code)
+        _validate_state(state)
+        key = ("city_list", country_code.lower(), state.lower())
+        city_list = self._reference_cache.get(key)
+        if city_list is None:
+            payload = {
+                'country_code': country_code.lower(),
+                'state': state.lower()
+            }
+            response = await self.request_handler.post("getlist/city_list", json_data=payload)
+            city_list = _extract_list(response, "city_list")
+            self._reference_cache.set(key, city_list, self._ttl(_REFERENCE_LIST_TTL))
+        return city_list
+
+    async def get_residential_isp_list(self, country_code: str) -> List[Dict[str, str]]:
+        """
+        Get the list of available Internet Service Providers (ISP) for Residential proxies based on country_code.
+
+        :param country_code: Country code (e.g., 'us').
+        :return: List of dictionaries with 'name', 'asn', and 'country'.
+        """
+        _validate_country_code(country_code)
+        key = ("isp_list", country_code.lower())
+        isp_list = self._reference_cache.get(key)
+        if isp_list is None:
+            payload = {
+                'country_code': country_code.lower()
+            }
+            response = await self.request_handler.post("getlist/isp_list", json_data=payload)
+            isp_list = _extract_list(response, "isp_list")
+            self._reference_cache.set(key, isp_list, self._ttl(_REFERENCE_LIST_TTL))
+        return isp_list
+
+    async def get_mobile_countries(self) -> List[Dict[str, Any]]:
+        """
+        Get the list of available countries for Mobile proxies.
+
+        :return: List of dictionaries with country information (id, name, iso2, region_id, geo_asns, asnData).
+        """
+        key = ("mobile_country",)
+        countries = self._reference_cache.get(key)
+        if countries is None:
+            response = await self.request_handler.post("getlist/mobile/country")
+            countries = _ensure_list(response)
+            self._reference_cache.set(key, countries, self._ttl(_COUNTRY_LIST_TTL))
+        return countries
+
+    async def get_product_info(self, plan_id: str) -> Dict:
+        """
+        Get general information about a product by planId.
+
+        :param plan_id: The plan identifier (planId) of the product you purchased.
+        :return: API response with general product information.
+        """
+        _validate_product_plan_id(plan_id)
+        return await self.request_handler.get(_EP_INFO + plan_id)
+
+    async def change_credentials(self, subscription_id: str, plan_type: str, username: str, password: str,
+                                 proxy_type: Optional[str] = None) -> Dict:
+        """
+        Change credentials (username and password) for a plan.
+
+        :param subscription_id: Subscription identifier (subscriptionId) of the plan.
+        :param plan_type: Plan type ('residential' or 'isp').
+        :param username: New username. Alphanumeric characters (a-z, A-Z, 0-9). Residential requires a minimum of 8 characters.
+        :param password: New password. Alphanumeric characters (a-z, A-Z, 0-9). Residential requires a minimum of 8 characters.
+        :param proxy_type: Proxy type ('http' or 'socks'). Used only for ISP. Omit for residential plans.
+        :return: API response with the result message.
+        """
+        payload = _build_credentials_payload(subscription_id, plan_type, username, password, proxy_type)
+        return await self.request_handler.post(f"credentials-change/{subscription_id}", json_data=payload)
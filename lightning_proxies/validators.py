@@ -1,27 +1,73 @@
 import re
 import ipaddress
+from functools import lru_cache
 from .exceptions import InvalidParameterError
 
+_VALID_PLAN_TYPES = frozenset({'residential', 'isp'})
+
+# Fast paths for the common address shapes; anything else falls back to ipaddress
+_IPV4_RE = re.compile(r'(?:(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])')
+_IPV6_FULL_RE = re.compile(r'(?:[0-9A-Fa-f]{1,4}:){7}[0-9A-Fa-f]{1,4}')
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_ip(ip: str) -> bool:
+    if _IPV4_RE.fullmatch(ip) or _IPV6_FULL_RE.fullmatch(ip):
+        return True
+    try:
+        ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_ascii_alnum(value: str) -> bool:
+    # isascii() rules out Unicode letters/digits that isalnum() alone would accept
+    return isinstance(value, str) and value.isascii() and value.isalnum()
+
+
+def _check_username(username: str, plan_type: str) -> bool:
+    if not _is_ascii_alnum(username):
+        raise InvalidParameterError("Username must contain only alphanumeric characters (a-z, A-Z, 0-9).")
+    if plan_type == 'residential' and len(username) < 8:
+        raise InvalidParameterError("Username must be at least 8 characters long for residential plans.")
+    return True
+
+
+# Only successful validations are cached; lru_cache does not store raised exceptions,
+# so invalid values are re-checked (and re-raised) on every call.
+_validated_username = lru_cache(maxsize=512)(_check_username)
+
+
 class Validator:
+    # Deprecated: kept for backward compatibility, validation no longer uses them
     USERNAME_REGEX = re.compile(r'^[A-Za-z0-9]+$')
     PASSWORD_REGEX = re.compile(r'^[A-Za-z0-9]+$')
 
     @staticmethod
     def validate_username(username: str, plan_type: str):
-        if not Validator.USERNAME_REGEX.match(username):
+        if not isinstance(username, str):
             raise InvalidParameterError("Username must contain only alphanumeric characters (a-z, A-Z, 0-9).")
-        if plan_type == 'residential' and len(username) < 8:
-            raise InvalidParameterError("Username must be at least 8 characters long for residential plans.")
+        if isinstance(plan_type, str):
+            _validated_username(username, plan_type)
+        else:
+            # Unhashable plan types cannot be cache keys
+            _check_username(username, plan_type)
 
     @staticmethod
     def validate_password(password: str, plan_type: str):
-        if not Validator.PASSWORD_REGEX.match(password):
+        # Not memoised: a cache would keep plaintext passwords alive for the process lifetime
+        if not _is_ascii_alnum(password):
             raise InvalidParameterError("Password must contain only alphanumeric characters (a-z, A-Z, 0-9).")
         if plan_type == 'residential' and len(password) < 8:
             raise InvalidParameterError("Password must be at least 8 characters long for residential plans.")
 
     @staticmethod
     def validate_ip(ip: str):
+        if isinstance(ip, str):
+            if not _is_valid_ip(ip):
+                raise InvalidParameterError("IP address must be valid.")
+            return
         try:
             ipaddress.ip_address(ip)
         except ValueError:
@@ -29,5 +75,10 @@ class Validator:
 
     @staticmethod
     def validate_plan_type(plan_type: str):
-        if plan_type not in ['residential', 'isp']:
+        try:
+            valid = plan_type in _VALID_PLAN_TYPES
+        except TypeError:
+            # Unhashable values (e.g. lists) are invalid too
+            valid = False
+        if not valid:
             raise ValueError("Plan type must be either 'residential' or 'isp'.")
\ No newline at end of file
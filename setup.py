@@ -17,11 +17,18 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     install_requires=[
         "requests>=2.25.1",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8",
+        ],
+        "speedups": [
+            "orjson>=3.0",
+            "ijson>=3.1",
+        ],
         "dev": [
             "pytest>=6.0",
             "flake8>=3.8",
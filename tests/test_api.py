@@ -1,18 +1,30 @@
+import gzip
+import io
+import json
+import sys
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import patch
 from lightning_proxies import LightningProxiesAPI, APIError, AuthenticationError, InvalidParameterError
+from lightning_proxies.api import _TTLCache
+try:
+    import ijson
+except ImportError:  # ijson is an optional dependency
+    ijson = None
+from lightning_proxies.validators import Validator, _validated_username
 
 class TestLightningProxiesAPI(unittest.TestCase):
     def setUp(self):
         self.api = LightningProxiesAPI(api_key="test_api_key")
 
-    @patch('lightning_proxies.api.requests.post')
+    @patch('lightning_proxies.api.requests.Session.post')
     def test_change_credentials_residential_success(self, mock_post):
         mock_response = unittest.mock.Mock()
-        mock_response.raise_for_status = unittest.mock.Mock()
-        mock_response.json.return_value = {
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
             "message": "Credentials updated successfully."
-        }
+        }).encode()
         mock_post.return_value = mock_response
 
         response = self.api.change_credentials(
@@ -23,13 +35,13 @@ class TestLightningProxiesAPI(unittest.TestCase):
         )
         self.assertEqual(response["message"], "Credentials updated successfully.")
 
-    @patch('lightning_proxies.api.requests.post')
+    @patch('lightning_proxies.api.requests.Session.post')
     def test_change_credentials_isp_success(self, mock_post):
         mock_response = unittest.mock.Mock()
-        mock_response.raise_for_status = unittest.mock.Mock()
-        mock_response.json.return_value = {
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
             "message": "Credentials updated successfully."
-        }
+        }).encode()
         mock_post.return_value = mock_response
 
         response = self.api.change_credentials(
@@ -41,7 +53,7 @@ class TestLightningProxiesAPI(unittest.TestCase):
         )
         self.assertEqual(response["message"], "Credentials updated successfully.")
 
-    @patch('lightning_proxies.api.requests.post')
+    @patch('lightning_proxies.api.requests.Session.post')
     def test_change_credentials_invalid_plan_type(self, mock_post):
         with self.assertRaises(ValueError):
             self.api.change_credentials(
@@ -51,7 +63,7 @@ class TestLightningProxiesAPI(unittest.TestCase):
                 password="Pass1234"
             )
 
-    @patch('lightning_proxies.api.requests.post')
+    @patch('lightning_proxies.api.requests.Session.post')
     def test_change_credentials_short_username_residential(self, mock_post):
         with self.assertRaises(InvalidParameterError):
             self.api.change_credentials(
@@ -61,7 +73,7 @@ class TestLightningProxiesAPI(unittest.TestCase):
                 password="Pass1234"
             )
 
-    @patch('lightning_proxies.api.requests.post')
+    @patch('lightning_proxies.api.requests.Session.post')
     def test_change_credentials_invalid_proxy_type_isp(self, mock_post):
         with self.assertRaises(ValueError):
             self.api.change_credentials(
@@ -72,7 +84,7 @@ class TestLightningProxiesAPI(unittest.TestCase):
                 proxy_type="ftp"  # Invalid value
             )
 
-    @patch('lightning_proxies.api.requests.post')
+    @patch('lightning_proxies.api.requests.Session.post')
     def test_change_credentials_proxy_type_for_residential(self, mock_post):
         with self.assertRaises(ValueError):
             self.api.change_credentials(
@@ -83,5 +95,384 @@ class TestLightningProxiesAPI(unittest.TestCase):
                 proxy_type="http"  # Should be omitted
             )
 
+    def test_context_manager_closes_session(self):
+        with patch('lightning_proxies.api.requests.Session.close') as mock_close:
+            with LightningProxiesAPI(api_key="test_api_key") as api:
+                self.assertEqual(api.request_handler.session.headers["x-api-key"], "test_api_key")
+            mock_close.assert_called_once()
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_residential_states_are_cached(self, mock_post):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"state_list": [{"code": "arizona"}]}).encode()
+        mock_post.return_value = mock_response
+
+        first = self.api.get_residential_states("US")
+        second = self.api.get_residential_states("us")
+        self.assertEqual(first, [{"code": "arizona"}])
+        self.assertEqual(second, first)
+        self.assertEqual(mock_post.call_count, 1)
+
+        self.api.invalidate_reference_cache()
+        self.api.get_residential_states("us")
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_cached_reference_list_is_not_shared(self, mock_post):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"country_list": [{"country_code": "us"}]}).encode()
+        mock_post.return_value = mock_response
+
+        first = self.api.get_residential_countries()
+        first.append({"country_code": "xx"})
+        first[0]["country_code"] = "changed"
+        second = self.api.get_residential_countries()
+        second.clear()
+        self.assertEqual(self.api.get_residential_countries(), [{"country_code": "us"}])
+        self.assertEqual(mock_post.call_count, 1)
+
+    def test_ttl_cache_concurrent_access(self):
+        cache = _TTLCache(maxsize=8)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    key = ((offset + i) % 32,)
+                    # Tiny TTLs so get() also hits the expiry path
+                    cache.set(key, [i], ttl=0.0001 if i % 2 else 60)
+                    cache.get(key)
+            except Exception as err:
+                errors.append(err)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache._data), 8)
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_reference_cache_disabled(self, mock_post):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"country_list": []}).encode()
+        mock_post.return_value = mock_response
+
+        api = LightningProxiesAPI(api_key="test_api_key", cache_ttl=0)
+        api.get_residential_countries()
+        api.get_residential_countries()
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_purchase_plan_isp_payload(self, mock_post):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"message": "ok"}).encode()
+        mock_post.return_value = mock_response
+
+        self.api.purchase_plan("ISP", ip=5, region="fra")
+        self.assertEqual(json.loads(mock_post.call_args.kwargs["data"]), {"ip": 5, "region": "fra"})
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_purchase_plan_invalid_option(self, mock_post):
+        with self.assertRaises(ValueError):
+            self.api.purchase_plan("satellite", bandwidth=1)
+        with self.assertRaises(ValueError):
+            self.api.purchase_plan(['ISP'], ip=5, region="fra")
+        with self.assertRaises(ValueError):
+            self.api.purchase_plan("ISP", ip=5, region="mars")
+        mock_post.assert_not_called()
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_manage_ipv6_whitelist_invalid_ip(self, mock_post):
+        for ip_address in ["256.1.1.1", "01.1.1.1", "1.1.1.1\n", "1:2:3:4:5:6:7:8:9",
+                           "\u0661.1.1.1", "1.1.1.\u0967", "\uff11.1.1.1"]:
+            with self.assertRaises(InvalidParameterError):
+                self.api.manage_ipv6_whitelist("add", "plan_id", ip_address)
+        mock_post.assert_not_called()
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_iter_residential_mass_check(self, mock_post):
+        pages = [
+            [{"id": 1}, {"id": 2}],
+            [{"id": 3}],
+            [],
+        ]
+        responses = []
+        for page in pages:
+            mock_response = unittest.mock.Mock()
+            mock_response.status_code = 200
+            mock_response.content = json.dumps(page).encode()
+            responses.append(mock_response)
+        mock_post.side_effect = responses
+
+        with patch('lightning_proxies.api.ijson', None):
+            records = list(self.api.iter_residential_mass_check(limit=2))
+        self.assertEqual(records, [{"id": 1}, {"id": 2}, {"id": 3}])
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertTrue(mock_post.call_args_list[2].args[0].endswith("plan/3-2"))
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_iter_residential_mass_check_validates_limit_eagerly(self, mock_post):
+        with self.assertRaises(ValueError):
+            self.api.iter_residential_mass_check(limit=0)
+        mock_post.assert_not_called()
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_iter_residential_mass_check_rejects_non_list(self, mock_post):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"message": "no records"}).encode()
+        mock_post.return_value = mock_response
+
+        with patch('lightning_proxies.api.ijson', None):
+            with self.assertRaises(APIError):
+                list(self.api.iter_residential_mass_check(limit=2))
+
+    def _stream_response(self, body, status_code=200):
+        response = unittest.mock.MagicMock()
+        response.status_code = status_code
+        response.reason = "Error"
+        response.url = "https://resell.lightningproxies.net/api/plan"
+        response.text = body.decode()
+        response.content = body
+        response.raw = io.BytesIO(body)
+        response.__enter__.return_value = response
+        return response
+
+    @unittest.skipIf(ijson is None, "ijson is not installed")
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_iter_residential_mass_check_streaming(self, mock_post):
+        # The server caps pages below the requested limit
+        mock_post.side_effect = [
+            self._stream_response(b'[{"id": 1, "gb": 1.5}, {"id": 2}]'),
+            self._stream_response(b'[{"id": 3}]'),
+            self._stream_response(b'[]'),
+        ]
+
+        records = list(self.api.iter_residential_mass_check(limit=500))
+        self.assertEqual(records, [{"id": 1, "gb": 1.5}, {"id": 2}, {"id": 3}])
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertTrue(mock_post.call_args.kwargs["stream"])
+
+    @unittest.skipIf(ijson is None, "ijson is not installed")
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_iter_residential_mass_check_streaming_errors(self, mock_post):
+        for response, error in [
+            (self._stream_response(b'not found', status_code=404), APIError),
+            (self._stream_response(b'unauthorized', status_code=401), AuthenticationError),
+            (self._stream_response(b'[{"id": 1}, {"id": '), APIError),
+            (self._stream_response(b'{"message": "no records"}'), APIError),
+        ]:
+            mock_post.side_effect = [response]
+            with self.assertRaises(error):
+                list(self.api.iter_residential_mass_check(limit=2))
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_manage_ipv6_whitelist_bulk(self, mock_post):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"message": "ok"}).encode()
+        mock_post.return_value = mock_response
+
+        responses = self.api.manage_ipv6_whitelist_bulk("add", "plan_id", ["1.1.1.1", "2.2.2.2", "1.1.1.1"])
+        self.assertEqual(responses, [{"message": "ok"}, {"message": "ok"}])
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_manage_ipv6_whitelist_bulk_validates_first(self, mock_post):
+        with self.assertRaises(InvalidParameterError):
+            self.api.manage_ipv6_whitelist_bulk("add", "plan_id", ["1.1.1.1", "not_an_ip"])
+        with self.assertRaises(ValueError):
+            self.api.manage_ipv6_whitelist_bulk("bogus", "plan_id", [])
+        with self.assertRaises(ValueError):
+            self.api.manage_ipv6_whitelist_bulk("add", "", [])
+        mock_post.assert_not_called()
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_manage_gigabyte_validation(self, mock_post):
+        with self.assertRaises(ValueError):
+            self.api.manage_residential_gigabyte("add", "plan_id", 1.5)
+        with self.assertRaises(ValueError):
+            self.api.manage_ipv6_gigabyte("remove", "plan_id", 1.5)
+        with self.assertRaises(ValueError):
+            self.api.manage_mobile_gigabyte("remove", "plan_id", True)
+        with self.assertRaises(ValueError):
+            self.api.manage_mobile_gigabyte("remove", "plan_id", 0)
+        mock_post.assert_not_called()
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_manage_residential_gigabyte_remove_decimal(self, mock_post):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"message": "ok"}).encode()
+        mock_post.return_value = mock_response
+
+        self.api.manage_residential_gigabyte("remove", "plan_id", 2.15)
+        self.assertTrue(mock_post.call_args.args[0].endswith("remove/plan_id/2.15"))
+
+    @patch('lightning_proxies.api.requests.Session.get')
+    def test_authentication_error(self, mock_get):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 401
+        mock_response.reason = "Unauthorized"
+        mock_response.text = "invalid api key"
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(AuthenticationError):
+            self.api.get_product_info("plan_id")
+
+    @patch('lightning_proxies.api.requests.Session.get')
+    def test_http_error(self, mock_get):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 404
+        mock_response.reason = "Not Found"
+        mock_response.text = "not found"
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(APIError) as ctx:
+            self.api.get_residential_proxy_info("plan_id")
+        self.assertNotIsInstance(ctx.exception, AuthenticationError)
+        self.assertIn("404", str(ctx.exception))
+
+    @patch('lightning_proxies.api.requests.Session.get')
+    def test_get_proxy_info_endpoints(self, mock_get):
+        mock_response = unittest.mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"planId": "plan_id"}).encode()
+        mock_get.return_value = mock_response
+
+        for kind in ("residential", "ipv6", "datacenter", "mobile", "isp"):
+            response = getattr(self.api, f"get_{kind}_proxy_info")("plan_id")
+            self.assertEqual(response, {"planId": "plan_id"})
+            self.assertTrue(mock_get.call_args.args[0].endswith(f"plan/{kind}/read/plan_id"))
+        with self.assertRaises(ValueError):
+            self.api.get_isp_proxy_info("")
+
+    def _serve(self, handler_class):
+        server = HTTPServer(("127.0.0.1", 0), handler_class)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        api = LightningProxiesAPI(api_key="test_api_key", base_url=f"http://127.0.0.1:{server.server_port}")
+        self.addCleanup(api.close)
+        return api
+
+    def test_get_retries_exhausted_raises_api_error(self):
+        hits = []
+
+        class UnavailableHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        api = self._serve(UnavailableHandler)
+        # Skip the retry backoff sleeps
+        api.request_handler.session.get_adapter("http://").max_retries.backoff_factor = 0
+        with self.assertRaises(APIError) as ctx:
+            api.get_product_info("plan_id")
+        self.assertIn("503", str(ctx.exception))
+        self.assertEqual(len(hits), 4)
+
+    @unittest.skipIf(ijson is None, "ijson is not installed")
+    def test_iter_residential_mass_check_streaming_over_socket(self):
+        pages = {
+            "/plan/1-2": b'[{"id": 1}, {"id": 2}]',
+            "/plan/2-2": b'[{"id": 3}]',
+            "/plan/3-2": b'[]',
+        }
+
+        for compress in (False, True):
+            class PagesHandler(BaseHTTPRequestHandler):
+                def do_POST(self):
+                    body = pages[self.path]
+                    self.send_response(200)
+                    if compress:
+                        body = gzip.compress(body)
+                        self.send_header("Content-Encoding", "gzip")
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            api = self._serve(PagesHandler)
+            records = list(api.iter_residential_mass_check(limit=2))
+            self.assertEqual(records, [{"id": 1}, {"id": 2}, {"id": 3}])
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_unhashable_arguments_raise_value_error(self, mock_post):
+        with self.assertRaises(ValueError):
+            self.api.manage_ipv6_whitelist(['add'], "plan_id", "1.1.1.1")
+        with self.assertRaises(ValueError):
+            self.api.manage_mobile_gigabyte(['remove'], "plan_id", 1)
+        with self.assertRaises(ValueError):
+            self.api.purchase_plan("ISP", ip=5, region=['fra'])
+        with self.assertRaises(ValueError):
+            self.api.purchase_plan("datacenter", plan=[1])
+        with self.assertRaises(ValueError):
+            self.api.change_credentials("valid_subscription_id", ['isp'], "ISPUser123", "ISPPass123", "http")
+        with self.assertRaises(ValueError):
+            self.api.change_credentials("valid_subscription_id", "isp", "ISPUser123", "ISPPass123", ['http'])
+        mock_post.assert_not_called()
+
+    @patch('lightning_proxies.api.requests.Session.post')
+    def test_change_credentials_rejects_non_ascii_and_non_str_username(self, mock_post):
+        for username in ['Usér1234', 'User123²', 12345678]:
+            with self.assertRaises(InvalidParameterError):
+                self.api.change_credentials(
+                    subscription_id="valid_subscription_id",
+                    plan_type="residential",
+                    username=username,
+                    password="Pass1234"
+                )
+        with self.assertRaises(InvalidParameterError):
+            self.api.change_credentials(
+                subscription_id="valid_subscription_id",
+                plan_type="residential",
+                username="NewUser123",
+                password="Passwörd1"
+            )
+        mock_post.assert_not_called()
+
+    def test_validate_username_memoised(self):
+        _validated_username.cache_clear()
+        Validator.validate_username("NewUser123", "residential")
+        Validator.validate_username("NewUser123", "residential")
+        info = _validated_username.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_validate_username_invalid_raises_every_call(self):
+        _validated_username.cache_clear()
+        for _ in range(2):
+            with self.assertRaises(InvalidParameterError):
+                Validator.validate_username("User1", "residential")
+        self.assertEqual(_validated_username.cache_info().currsize, 0)
+
+    def test_validate_username_non_str_plan_type(self):
+        _validated_username.cache_clear()
+        Validator.validate_username("User1", ['isp'])
+        with self.assertRaises(InvalidParameterError):
+            Validator.validate_username("User 1", ['isp'])
+        self.assertEqual(_validated_username.cache_info().currsize, 0)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
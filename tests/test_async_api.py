@@ -0,0 +1,107 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import AsyncMock, patch
+
+try:
+    from lightning_proxies.async_api import AsyncLightningProxiesAPI
+except ImportError:  # aiohttp is an optional dependency
+    AsyncLightningProxiesAPI = None
+
+from lightning_proxies import APIError, AuthenticationError, InvalidParameterError
+
+
+@unittest.skipIf(AsyncLightningProxiesAPI is None, "aiohttp is not installed")
+class TestAsyncLightningProxiesAPI(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.api = AsyncLightningProxiesAPI(api_key="test_api_key")
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    @patch('lightning_proxies.async_api.AsyncRequestHandler.post', new_callable=AsyncMock)
+    async def test_change_credentials_residential_success(self, mock_post):
+        mock_post.return_value = {"message": "Credentials updated successfully."}
+
+        response = await self.api.change_credentials(
+            subscription_id="valid_subscription_id",
+            plan_type="residential",
+            username="NewUser123",
+            password="NewPass123"
+        )
+        self.assertEqual(response["message"], "Credentials updated successfully.")
+
+    @patch('lightning_proxies.async_api.AsyncRequestHandler.post', new_callable=AsyncMock)
+    async def test_bulk_whitelist(self, mock_post):
+        mock_post.return_value = {"message": "ok"}
+
+        responses = await self.api.bulk_whitelist("add", "plan_id", ["1.1.1.1", "2.2.2.2"])
+        self.assertEqual(len(responses), 2)
+        called = sorted(call.args[0] for call in mock_post.call_args_list)
+        self.assertEqual(called, [
+            "plan/ipv6/add/whitelist/plan_id/1.1.1.1",
+            "plan/ipv6/add/whitelist/plan_id/2.2.2.2",
+        ])
+
+    @patch('lightning_proxies.async_api.AsyncRequestHandler.post', new_callable=AsyncMock)
+    async def test_bulk_whitelist_invalid_ip(self, mock_post):
+        with self.assertRaises(InvalidParameterError):
+            await self.api.bulk_whitelist("add", "plan_id", ["1.1.1.1", "not_an_ip"])
+        with self.assertRaises(ValueError):
+            await self.api.bulk_whitelist("bogus", "plan_id", [])
+        with self.assertRaises(ValueError):
+            await self.api.bulk_whitelist("add", "", [])
+        mock_post.assert_not_called()
+
+    def _serve(self, status, body):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return AsyncLightningProxiesAPI(api_key="test_api_key", base_url=f"http://127.0.0.1:{server.server_port}")
+
+    async def test_response_decoded(self):
+        api = self._serve(200, b'{"planId": "plan_id"}')
+        try:
+            self.assertEqual(await api.get_product_info("plan_id"), {"planId": "plan_id"})
+        finally:
+            await api.close()
+
+    async def test_empty_body_raises_api_error(self):
+        api = self._serve(200, b'')
+        try:
+            with self.assertRaises(APIError):
+                await api.get_product_info("plan_id")
+        finally:
+            await api.close()
+
+    async def test_http_errors_match_sync_format(self):
+        api = self._serve(404, b'not found')
+        try:
+            with self.assertRaises(APIError) as ctx:
+                await api.get_product_info("plan_id")
+            self.assertNotIsInstance(ctx.exception, AuthenticationError)
+            self.assertIn("404 Not Found for url: http://127.0.0.1:", str(ctx.exception))
+        finally:
+            await api.close()
+
+        api = self._serve(401, b'invalid api key')
+        try:
+            with self.assertRaises(AuthenticationError):
+                await api.get_product_info("plan_id")
+        finally:
+            await api.close()
+
+if __name__ == '__main__':
+    unittest.main()